@@ -2,6 +2,7 @@ import numpy as np
 import pygame
 import sys
 import os
+from terrain import Terrain, TerrainView
 
 # Parameters
 A, B, C = 0.3, 0.2, 0.1
@@ -10,9 +11,9 @@ nx = 1000  # Number of spatial points
 X_min, X_max = -400, 400  # X range
 dx = (X_max - X_min) / nx
 
-# Define the terrain function Z(X) with periodic boundary conditions
-X = np.linspace(X_min, X_max, nx)
-Z = A * np.cos(w * X) + B * np.sin(k * X) + C * np.sin(j * X)
+# Terrain streamed in chunks; X_min..X_max only sets the vertical scale and start view
+terrain = Terrain(A, B, C, w, k, j)
+Z = terrain.height(np.linspace(X_min, X_max, nx))
 
 # Initialize Pygame
 pygame.init()
@@ -21,25 +22,11 @@ screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 pygame.display.set_caption("Terrain Visualization")
 clock = pygame.time.Clock()
 
-def draw_terrain(Z):
-    screen.fill((173, 216, 230))  # Light cyan background
-    terrain_points = []
-
-    # Calculate scaling factors
-    min_Z, max_Z = np.min(Z), np.max(Z)
-    height_scale = WINDOW_HEIGHT / 2 * (max_Z - min_Z)
-    width_scale = WINDOW_WIDTH / nx
-
-    for i in range(nx):
-        terrain_height = WINDOW_HEIGHT - int((Z[i] - min_Z) * height_scale) - 100
-        screen_x = int(i * width_scale)
-        
-        terrain_points.append((screen_x, terrain_height))
-    
-    terrain_points.append((WINDOW_WIDTH, WINDOW_HEIGHT))
-    terrain_points.append((0, WINDOW_HEIGHT))
-    
-    pygame.draw.polygon(screen, (139, 69, 19), terrain_points)  # Brown terrain
+# Cached terrain surface, redrawn only when the camera moves
+pixels_per_unit = WINDOW_WIDTH / (X_max - X_min)
+terrain_view = TerrainView(terrain, (WINDOW_WIDTH, WINDOW_HEIGHT), np.min(Z), np.max(Z), pixels_per_unit=pixels_per_unit, sky_color=(173, 216, 230))
+camera_x = X_min
+scroll_speed = 10
 
 # Main loop
 running = True
@@ -55,8 +42,14 @@ while running:
                 pygame.image.save(screen, screenshot_path)
                 print(f"Screenshot saved to {screenshot_path}")
 
+    keys = pygame.key.get_pressed()
+    if keys[pygame.K_LEFT]:
+        camera_x -= scroll_speed
+    if keys[pygame.K_RIGHT]:
+        camera_x += scroll_speed
+
     # Render the terrain
-    draw_terrain(Z)
+    screen.blit(terrain_view.render(camera_x), (0, 0))
     pygame.display.flip()
 
     # Control the frame rate
@@ -0,0 +1,106 @@
+import numpy as np
+import pygame
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+BROWN = (139, 69, 19)
+
+class Minimap:
+    def __init__(self, size, world_size, walls, floor_rect=None, background_color=BROWN, floor_color=WHITE, heat_strength=0.8):
+        self.size = np.array(size)
+        self.world_size = np.array(world_size, dtype=float)
+        self.walls = walls
+        self.heat_strength = heat_strength
+
+        # Fit the whole world into the minimap, keeping its aspect ratio
+        self.scale = min(self.size[0] / self.world_size[0], self.size[1] / self.world_size[1])
+        self.map_size = (int(self.world_size[0] * self.scale), int(self.world_size[1] * self.scale))
+        self.offset = (self.size - np.array(self.map_size)) // 2
+
+        # Aggregated occupancy, one cell per minimap pixel, indexed (x, y) like pygame.surfarray
+        self.occupancy = np.zeros(self.map_size, dtype=np.float32)
+
+        # Render the static layers once and keep them as arrays
+        background = pygame.Surface(self.map_size)
+        background.fill(background_color)
+        if floor_rect is not None:
+            x, y, w, h = floor_rect
+            pygame.draw.rect(background, floor_color, pygame.Rect(x * self.scale, y * self.scale, w * self.scale, h * self.scale))
+        self.base = pygame.surfarray.array3d(background).astype(np.float32)
+
+        wall_layer = pygame.Surface(self.map_size)
+        wall_layer.fill(BLACK)
+        for wall_start, wall_end, color in walls:
+            start = np.array(wall_start) * self.scale
+            end = np.array(wall_end) * self.scale
+            pygame.draw.line(wall_layer, color, start, end, 2)
+        self.wall_rgb = pygame.surfarray.array3d(wall_layer)
+        self.wall_mask = self.wall_rgb.any(axis=2)
+
+        self.map_surface = pygame.Surface(self.map_size)
+
+    def world_to_cells(self, positions):
+        cells = (np.asarray(positions, dtype=float).reshape(-1, 2) * self.scale).astype(int)
+        cells[:, 0] = np.clip(cells[:, 0], 0, self.map_size[0] - 1)
+        cells[:, 1] = np.clip(cells[:, 1], 0, self.map_size[1] - 1)
+        return cells
+
+    def record(self, positions):
+        # Accumulate visits; np.add.at handles several agents in the same cell
+        if len(positions) == 0:
+            return
+        cells = self.world_to_cells(positions)
+        np.add.at(self.occupancy, (cells[:, 0], cells[:, 1]), 1)
+
+    def reset(self):
+        self.occupancy.fill(0)
+
+    def render_heatmap(self):
+        # Log scale so a few crowded cells don't wash out the rest of the map
+        peak = self.occupancy.max()
+        if peak > 0:
+            t = np.log1p(self.occupancy) / np.log1p(peak)
+        else:
+            t = self.occupancy
+        heat = np.empty_like(self.base)
+        heat[..., 0] = 255
+        heat[..., 1] = 255 * (1 - t)
+        heat[..., 2] = 0
+        alpha = (self.heat_strength * t)[..., None]
+        rgb = self.base * (1 - alpha) + heat * alpha
+        rgb[self.wall_mask] = self.wall_rgb[self.wall_mask]
+        return rgb.astype(np.uint8)
+
+    def draw(self, surface, camera_pos, view_size, positions=(), colors=(), dot_size=3):
+        rgb = self.render_heatmap()
+
+        # Stamp agents as small squares straight into the pixel array
+        if len(positions) > 0:
+            cells = self.world_to_cells(positions)
+            offsets = np.arange(dot_size) - dot_size // 2
+            xs = np.clip(cells[:, 0, None, None] + offsets[None, :, None], 0, self.map_size[0] - 1)
+            ys = np.clip(cells[:, 1, None, None] + offsets[None, None, :], 0, self.map_size[1] - 1)
+            xs, ys = np.broadcast_arrays(xs, ys)
+            dot_colors = np.broadcast_to(np.asarray(colors, dtype=np.uint8)[:, None, None, :], xs.shape + (3,))
+            rgb[xs, ys] = dot_colors
+
+        pygame.surfarray.blit_array(self.map_surface, rgb)
+        surface.fill(BLACK)
+        surface.blit(self.map_surface, self.offset)
+
+        # Outline the part of the world currently shown in the main scene
+        view_rect = pygame.Rect(
+            self.offset[0] + camera_pos[0] * self.scale,
+            self.offset[1] + camera_pos[1] * self.scale,
+            view_size[0] * self.scale,
+            view_size[1] * self.scale
+        )
+        pygame.draw.rect(surface, WHITE, view_rect, 1)
+
+    def screen_to_world(self, pos):
+        # Returns None when pos falls outside the drawn map
+        local = np.array(pos) - self.offset
+        if not (0 <= local[0] < self.map_size[0] and 0 <= local[1] < self.map_size[1]):
+            return None
+        return local / self.scale
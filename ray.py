@@ -1,6 +1,7 @@
 import pygame
 import numpy as np
 from agent import Agent
+from minimap import Minimap
 import time
 
 # Initialize Pygame
@@ -65,6 +66,10 @@ walls = [
 start_position = [200, 200]
 agents = [Agent(position=start_position, walls=walls, color=color) for color in AGENT_COLORS]
 
+# Minimap with a visitation heatmap of the whole world
+minimap_pos = (0, MAIN_SCENE_HEIGHT)
+world_map = Minimap(minimap.get_size(), (TOTAL_WIDTH, TOTAL_HEIGHT), walls, floor_rect=(100, 100, 1800, 1300))
+
 def spawn_new_generation(best_agent):
     new_agents = []
     for color in AGENT_COLORS:
@@ -103,6 +108,11 @@ while running:
                 running = False
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left mouse button
+                # Clicking the minimap centers the camera on that spot
+                world_pos = world_map.screen_to_world(np.array(event.pos) - minimap_pos)
+                if minimap.get_rect(topleft=minimap_pos).collidepoint(event.pos) and world_pos is not None:
+                    camera_pos = (world_pos - np.array([MAIN_SCENE_WIDTH, MAIN_SCENE_HEIGHT]) / 2).astype(int)
+                    continue
                 dragging = True
                 drag_start_pos = pygame.mouse.get_pos()
                 drag_camera_start_pos = camera_pos.copy()
@@ -130,6 +140,12 @@ while running:
         agent.neural_move()
         agent.update_lifespan()
 
+    # Aggregate alive agent positions into the minimap heatmap
+    alive_agents = [agent for agent in agents if agent.alive]
+    agent_positions = np.array([agent.position for agent in alive_agents]).reshape(-1, 2)
+    agent_colors = np.array([agent.color for agent in alive_agents]).reshape(-1, 3)
+    world_map.record(agent_positions)
+
     # Clear surfaces
     main_scene.fill(BROWN)  # Fill the entire scene with brown
     
@@ -161,6 +177,9 @@ while running:
     for agent in agents:
         agent.draw(main_scene, camera_pos)
 
+    # Draw minimap
+    world_map.draw(minimap, camera_pos, (MAIN_SCENE_WIDTH, MAIN_SCENE_HEIGHT), agent_positions, agent_colors)
+
     # Draw borders
     pygame.draw.rect(main_scene, BLACK, main_scene.get_rect(), 4)
     pygame.draw.rect(gui_area, BLACK, gui_area.get_rect(), 4)
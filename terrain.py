@@ -0,0 +1,85 @@
+from collections import OrderedDict
+import numpy as np
+import pygame
+
+# Colors
+BROWN = (139, 69, 19)
+
+class Terrain:
+    def __init__(self, A, B, C, w, k, j, chunk_width=200, samples_per_chunk=250, max_chunks=16):
+        # Z(X) = A cos(wX) + B sin(kX) + C sin(jX), defined for any X
+        self.A, self.B, self.C = A, B, C
+        self.w, self.k, self.j = w, k, j
+        self.chunk_width = chunk_width
+        self.samples_per_chunk = samples_per_chunk
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()  # chunk index -> (X, Z), least recently used first
+
+    def height(self, x):
+        x = np.asarray(x, dtype=float)
+        return self.A * np.cos(self.w * x) + self.B * np.sin(self.k * x) + self.C * np.sin(self.j * x)
+
+    def slope(self, x):
+        x = np.asarray(x, dtype=float)
+        return -self.A * self.w * np.sin(self.w * x) + self.B * self.k * np.cos(self.k * x) + self.C * self.j * np.cos(self.j * x)
+
+    def normal(self, x):
+        # Unit normal (nx, nz) with Z pointing up, shape x.shape + (2,)
+        dz = self.slope(x)
+        length = np.sqrt(1 + dz ** 2)
+        return np.stack([-dz / length, 1 / length], axis=-1)
+
+    def get_chunk(self, index):
+        if index in self.chunks:
+            self.chunks.move_to_end(index)
+            return self.chunks[index]
+        X = index * self.chunk_width + np.linspace(0, self.chunk_width, self.samples_per_chunk + 1)
+        chunk = (X, self.height(X))
+        self.chunks[index] = chunk
+        if len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return chunk
+
+    def samples(self, x_start, x_end):
+        # Concatenated samples of every chunk overlapping [x_start, x_end]
+        first = int(np.floor(x_start / self.chunk_width))
+        last = int(np.floor(x_end / self.chunk_width))
+        chunks = [self.get_chunk(index) for index in range(first, last + 1)]
+        X = np.concatenate([chunk[0] for chunk in chunks])
+        Z = np.concatenate([chunk[1] for chunk in chunks])
+        return X, Z
+
+class TerrainView:
+    def __init__(self, terrain, size, min_Z, max_Z, pixels_per_unit=1.0, baseline=100, color=BROWN, sky_color=None):
+        self.terrain = terrain
+        self.size = size
+        self.min_Z, self.max_Z = min_Z, max_Z
+        self.pixels_per_unit = pixels_per_unit
+        self.baseline = baseline
+        self.color = color
+        self.sky_color = sky_color
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.camera_x = None
+
+    def invalidate(self):
+        self.camera_x = None
+
+    def to_screen(self, X, Z, camera_x):
+        width, height = self.size
+        height_scale = height / 2 * (self.max_Z - self.min_Z)
+        screen_x = ((X - camera_x) * self.pixels_per_unit).astype(int)
+        screen_y = height - ((Z - self.min_Z) * height_scale).astype(int) - self.baseline
+        return np.column_stack([screen_x, screen_y])
+
+    def render(self, camera_x):
+        # Only redraw the polygon when the visible part of the world changed
+        if camera_x == self.camera_x:
+            return self.surface
+        width, height = self.size
+        X, Z = self.terrain.samples(camera_x, camera_x + width / self.pixels_per_unit)
+        points = np.vstack([self.to_screen(X, Z, camera_x), [[width, height], [0, height]]])
+
+        self.surface.fill(self.sky_color if self.sky_color is not None else (0, 0, 0, 0))
+        pygame.draw.polygon(self.surface, self.color, points.tolist())
+        self.camera_x = camera_x
+        return self.surface